@@ -1,5 +1,10 @@
 import asyncio
+import json
 import logging
+import math
+import os
+import time
+from typing import Optional
 import discord
 from discord.ext import commands
 from bot.verification import send_verification_message
@@ -28,6 +33,9 @@ class RoleManagerBot(commands.Bot):
         }
         self.role_update_queue: dict[int, list[discord.Role]] = {}
         self.startup_channel_id: int = 1094604434195107921
+        self.role_check_period: int = 43200
+        self.role_check_slice_size: int = 100
+        self.role_check_cursor_path: str = "role_check_cursor.json"
 
     async def send_startup_message(self) -> None:
         """
@@ -191,43 +199,93 @@ class RoleManagerBot(commands.Bot):
         """
         await self.update_bot_activity()
 
-    async def check_and_assign_role(self, guild: discord.Guild, role_id: int) -> None:
+    def load_role_check_cursor(self) -> Optional[int]:
         """
-        Checks and assigns a role to all members in the guild.
+        Loads the persisted role check cursor.
+
+        Returns:
+            Optional[int]: The ID of the last member reconciled, or None to start from the beginning.
+        """
+        try:
+            with open(self.role_check_cursor_path, "r") as f:
+                after = json.load(f).get("after")
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError, AttributeError) as e:
+            logging.error(f"Failed to load role check cursor: {e}")
+            return None
+
+        if after is not None and (not isinstance(after, int) or isinstance(after, bool)):
+            logging.error(f"Invalid role check cursor: {after!r}")
+            return None
+        return after
+
+    def save_role_check_cursor(self, after: Optional[int]) -> None:
+        """
+        Persists the role check cursor so a restart resumes where it stopped.
 
         Args:
-            guild (discord.Guild): The guild in which to assign roles.
-            role_id (int): The ID of the role to assign.
+            after (Optional[int]): The ID of the last member reconciled, or None to restart the sweep.
         """
-        role = guild.get_role(role_id)
-        if not role:
-            logging.error(f"Role with ID {role_id} not found.")
-            return
+        tmp_path = f"{self.role_check_cursor_path}.tmp"
+        try:
+            with open(tmp_path, "w") as f:
+                json.dump({"after": after}, f)
+            os.replace(tmp_path, self.role_check_cursor_path)
+        except OSError as e:
+            logging.error(f"Failed to save role check cursor: {e}")
 
-        limit = 1000
-        after = None
+    async def check_and_assign_role_slice(self, guild: discord.Guild, role_id: int, after: Optional[int]) -> Optional[int]:
+        """
+        Checks and assigns a role to the next slice of members, ordered by member ID.
 
-        while True:
-            members = []
-            async for member in guild.fetch_members(limit=limit, after=after):
-                members.append(member)
-                await self.assign_role_to_member(member, role_id)
+        Args:
+            guild (discord.Guild): The guild in which to assign roles.
+            role_id (int): The ID of the role to assign.
+            after (Optional[int]): The member ID to resume after, or None to start from the beginning.
 
-            if len(members) < limit:
-                break
+        Returns:
+            Optional[int]: The ID of the last member checked, or None once the sweep has covered the guild.
+        """
+        members = []
+        after_object = discord.Object(id=after) if after is not None else None
+        async for member in guild.fetch_members(limit=self.role_check_slice_size, after=after_object):
+            members.append(member)
+            await self.assign_role_to_member(member, role_id)
 
-            after = members[-1]
+        if len(members) < self.role_check_slice_size:
+            return None
 
-        logging.info("Finished assigning roles to all members.")
+        return members[-1].id
 
     async def periodic_role_check(self) -> None:
         """
-        Periodically checks and assigns roles to members in the guild.
+        Continuously checks and assigns roles to members in the guild, one slice at a time.
+
+        Slices are spaced so the whole guild is covered once every role_check_period seconds,
+        and the cursor is persisted after each slice.
         """
         await self.wait_until_ready()
         guild_id = 372369352173027331
+        role_id = 372378135557308427
+        after = self.load_role_check_cursor()
         while not self.is_closed():
+            started = time.monotonic()
             guild = self.get_guild(guild_id)
+            slice_count = 1
             if guild:
-                await self.check_and_assign_role(guild, 372378135557308427)
-            await asyncio.sleep(43200)
+                if not guild.get_role(role_id):
+                    logging.error(f"Role with ID {role_id} not found.")
+                else:
+                    try:
+                        after = await self.check_and_assign_role_slice(guild, role_id, after)
+                        self.save_role_check_cursor(after)
+                        if after is None:
+                            logging.info("Finished assigning roles to all members.")
+                    except Exception as e:
+                        logging.error(f"Error during periodic role check: {e}")
+                slice_count = max(1, math.ceil((guild.member_count or 0) / self.role_check_slice_size))
+
+            # One extra slot for the short (possibly empty) fetch that ends the sweep.
+            interval = self.role_check_period / (slice_count + 1)
+            await asyncio.sleep(max(0.0, interval - (time.monotonic() - started)))